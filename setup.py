@@ -37,8 +37,13 @@ setup(
         "requests>=2.31.0",
         "beautifulsoup4>=4.12.0",
         "pyyaml>=6.0",
+        "numpy>=1.17.0",
     ],
     extras_require={
+        "fast": [
+            "numba>=0.50.0",
+            "orjson>=3.0.0",
+        ],
         "dev": [
             "pytest>=7.0.0",
             "pytest-cov>=4.0.0",
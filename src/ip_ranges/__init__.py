@@ -10,6 +10,6 @@ __version__ = "1.0.0"
 __author__ = "IP Ranges Contributors"
 
 from .scraper import IPRangeScraper
-from .converter import CIDRConverter
+from .converter import CIDRConverter, ZoneRanges
 
-__all__ = ["IPRangeScraper", "CIDRConverter", "__version__"]
+__all__ = ["IPRangeScraper", "CIDRConverter", "ZoneRanges", "__version__"]
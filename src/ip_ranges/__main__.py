@@ -58,6 +58,12 @@ Examples:
         "-o",
         help="Output directory for zone files (default: data/ip_zones)",
     )
+    scrape_parser.add_argument(
+        "--threads",
+        "-t",
+        type=int,
+        help="Number of concurrent downloads (default: 16)",
+    )
 
     # Convert command
     convert_parser = subparsers.add_parser("convert", help="Convert CIDR notation to IP ranges")
@@ -95,7 +101,7 @@ Examples:
         "-t",
         type=int,
         default=1,
-        help="Number of threads to use for processing (default: 1)",
+        help="Number of worker processes to use for processing (default: 1)",
     )
 
     convert_parser.add_argument(
@@ -134,7 +140,9 @@ def main():
         logger.info("=" * 60)
 
         try:
-            stats = scrape_ip_ranges(output_dir=args.output, config=config)
+            stats = scrape_ip_ranges(
+                output_dir=args.output, max_workers=args.threads, config=config
+            )
 
             if stats["failed"] > 0:
                 sys.exit(1)
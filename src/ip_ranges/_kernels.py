@@ -0,0 +1,150 @@
+"""Optional Numba-compiled kernels for the converter.
+
+Numba is an optional dependency (``pip install ip-ranges[fast]``). When it
+is not installed ``HAVE_NUMBA`` is False and callers fall back to the
+NumPy implementations in :mod:`ip_ranges.converter`.
+"""
+
+import numpy as np
+
+try:
+    import numba
+except ImportError:  # pragma: no cover - depends on the environment
+    numba = None
+
+
+HAVE_NUMBA = numba is not None
+
+# Decimal digits and digit count of every octet value (0-255)
+_OCTET_DIGITS = (
+    np.array([str(i).encode("ascii") for i in range(256)], dtype="S3")
+    .view(np.uint8)
+    .reshape(256, 3)
+)
+_OCTET_LENGTHS = np.array([len(str(i)) for i in range(256)], dtype=np.uint8)
+
+
+if HAVE_NUMBA:
+
+    @numba.njit(cache=True)
+    def _is_space(c):
+        return c == 32 or c == 9 or c == 13
+
+    @numba.njit(cache=True)
+    def _parse_cidr(buf, start, end):
+        """Parse "a.b.c.d/p" in buf[start:end]; returns (ok, ip, prefix)."""
+        ip = 0
+        value = 0
+        ndigits = 0
+        field = 0
+        for i in range(start, end):
+            c = buf[i]
+            if 48 <= c <= 57:
+                value = value * 10 + (c - 48)
+                ndigits += 1
+                if ndigits > 3:
+                    return False, 0, 0
+            elif (c == 46 and field < 3) or (c == 47 and field == 3):
+                if ndigits == 0 or value > 255:
+                    return False, 0, 0
+                ip = (ip << 8) | value
+                value = 0
+                ndigits = 0
+                field += 1
+            else:
+                return False, 0, 0
+
+        if ndigits == 0:
+            return False, 0, 0
+        if field == 3:
+            # A bare address is accepted as a /32
+            if value > 255:
+                return False, 0, 0
+            return True, (ip << 8) | value, 32
+        if field != 4 or value > 32:
+            return False, 0, 0
+        return True, ip, value
+
+    @numba.njit(cache=True, nogil=True)
+    def parse_zone_bytes(buf, out_prefix, out_net, out_bcast, out_total, out_invalid):
+        """Parse a zone file buffer into preallocated output arrays.
+
+        Args:
+            buf: File contents as a uint8 array
+            out_prefix: uint8 output array, one slot per line
+            out_net: uint32 output array, one slot per line
+            out_bcast: uint32 output array, one slot per line
+            out_total: uint64 output array, one slot per line
+            out_invalid: int64 output array receiving invalid line numbers
+
+        Returns:
+            Tuple of (number of ranges, number of invalid lines)
+        """
+        n = buf.size
+        count = 0
+        invalid = 0
+        line_num = 0
+        i = 0
+        while i < n:
+            line_num += 1
+            j = i
+            while j < n and buf[j] != 10:
+                j += 1
+
+            start = i
+            end = j
+            i = j + 1
+            while start < end and _is_space(buf[start]):
+                start += 1
+            while end > start and _is_space(buf[end - 1]):
+                end -= 1
+
+            # Skip empty lines and comments
+            if start == end or buf[start] == 35:
+                continue
+
+            ok, ip, prefix = _parse_cidr(buf, start, end)
+            if not ok:
+                out_invalid[invalid] = line_num
+                invalid += 1
+                continue
+
+            hostmask = np.uint64(0xFFFFFFFF) >> np.uint64(prefix)
+            network = np.uint64(ip) & ~hostmask & np.uint64(0xFFFFFFFF)
+            out_prefix[count] = prefix
+            out_net[count] = network
+            out_bcast[count] = network | hostmask
+            out_total[count] = hostmask + np.uint64(1)
+            count += 1
+
+        return count, invalid
+
+    @numba.njit(cache=True, nogil=True)
+    def format_ipv4_batch(ips, out):
+        """Write uint32 addresses into out as newline-terminated dotted quads.
+
+        Digits come from _OCTET_DIGITS/_OCTET_LENGTHS, so each octet is a
+        table lookup and a short copy instead of a division chain.
+
+        Args:
+            ips: uint32 array of addresses
+            out: uint8 output array of at least 16 bytes per address
+
+        Returns:
+            Number of bytes written
+        """
+        pos = 0
+        for i in range(ips.size):
+            ip = ips[i]
+            for shift in range(24, -8, -8):
+                octet = (ip >> shift) & 0xFF
+                for d in range(_OCTET_LENGTHS[octet]):
+                    out[pos + d] = _OCTET_DIGITS[octet, d]
+                pos += _OCTET_LENGTHS[octet]
+                out[pos] = 46 if shift else 10
+                pos += 1
+        return pos
+
+else:
+    parse_zone_bytes = None
+    format_ipv4_batch = None
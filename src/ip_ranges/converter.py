@@ -7,16 +7,225 @@ to IP ranges in multiple formats (JSON, CSV, TXT).
 import concurrent.futures
 import json
 import logging
-import random
 import ipaddress
 from pathlib import Path
-from typing import List, Dict, Optional, Set, Union
+from typing import List, Dict, NamedTuple, Optional, Set, Tuple, Union
 
+import numpy as np
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+from ._kernels import _OCTET_DIGITS, HAVE_NUMBA, format_ipv4_batch, parse_zone_bytes
 from .utils import ensure_directory, validate_cidr
 
 
 logger = logging.getLogger(__name__)
 
+# Longest valid IPv4 CIDR: "255.255.255.255/32"
+_MAX_CIDR_LENGTH = 18
+
+# Number of addresses formatted per batch when writing TXT output
+_TXT_CHUNK_SIZE = 1 << 16
+
+# Number of rows joined into a single write for CSV output
+_CSV_BATCH_ROWS = 8192
+
+# Userspace buffer for output files
+_WRITE_BUFFER_SIZE = 1 << 20
+
+# Separator expected after each field of "a.b.c.d/p" (0 marks end of line)
+_FIELD_SEPARATORS = np.array([ord("."), ord("."), ord("."), ord("/"), 0], dtype=np.uint8)
+
+
+class ZoneRanges(NamedTuple):
+    """IPv4 ranges of a zone file stored as parallel arrays.
+
+    Attributes:
+        prefix: Prefix lengths (uint8)
+        network: First address of each range (uint32)
+        broadcast: Last address of each range (uint32)
+        total: Number of addresses in each range (uint64)
+    """
+
+    prefix: np.ndarray
+    network: np.ndarray
+    broadcast: np.ndarray
+    total: np.ndarray
+
+    @classmethod
+    def empty(cls) -> "ZoneRanges":
+        """Create an empty set of ranges."""
+        return cls(
+            np.empty(0, np.uint8),
+            np.empty(0, np.uint32),
+            np.empty(0, np.uint32),
+            np.empty(0, np.uint64),
+        )
+
+    @property
+    def size(self) -> int:
+        """Number of ranges."""
+        return self.network.size
+
+    @property
+    def total_ips(self) -> int:
+        """Number of addresses across all ranges."""
+        return int(self.total.sum())
+
+    def cidrs(self) -> List[str]:
+        """Format the ranges as CIDR strings."""
+        return [
+            f"{network}/{prefix}"
+            for network, prefix in zip(_format_ipv4(self.network), self.prefix.tolist())
+        ]
+
+
+def _parse_cidr_lines(lines: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Parse stripped IPv4 CIDR lines column by column.
+
+    Every row is scanned in lockstep, so the per-character work is a handful
+    of uint32 operations across the whole array rather than a Python loop
+    per line.
+
+    Args:
+        lines: Array of stripped byte strings (dtype ``S``)
+
+    Returns:
+        Tuple of (ip_u32, prefix_u8, valid_mask)
+    """
+    n = lines.size
+    if n == 0:
+        return np.empty(0, np.uint32), np.empty(0, np.uint8), np.empty(0, bool)
+
+    width = _MAX_CIDR_LENGTH
+    valid = np.char.str_len(lines) <= width
+    chars = lines.astype(f"S{width}").view(np.uint8).reshape(n, width)
+
+    fields = np.zeros((n, 5), dtype=np.uint32)
+    field = np.zeros(n, dtype=np.intp)
+    acc = np.zeros(n, dtype=np.uint32)
+    ndigits = np.zeros(n, dtype=np.uint8)
+    done = ~valid
+
+    # One extra column of zeros terminates every row
+    for col in range(width + 1):
+        ch = chars[:, col] if col < width else np.zeros(n, dtype=np.uint8)
+        active = ~done
+        digit = active & (ch >= ord("0")) & (ch <= ord("9"))
+        sep = active & ~digit
+
+        acc = np.where(digit, acc * 10 + (ch - ord("0")), acc)
+        ndigits += digit
+
+        # A bare address (no "/p") is accepted as a /32
+        expected = _FIELD_SEPARATORS[np.minimum(field, 4)]
+        bare = (field == 3) & (ch == 0)
+        ok = sep & ((ch == expected) | bare) & (ndigits >= 1) & (ndigits <= 3)
+        valid &= ~sep | ok
+
+        rows = np.flatnonzero(ok)
+        fields[rows, field[rows]] = acc[rows]
+        field[rows] += 1
+        acc[rows] = 0
+        ndigits[rows] = 0
+
+        rows = np.flatnonzero(ok & bare)
+        fields[rows, 4] = 32
+        field[rows] = 5
+        done |= sep & ((ch == 0) | ~ok)
+
+    octets = fields[:, :4]
+    prefix = fields[:, 4]
+    valid &= (field == 5) & (octets <= 255).all(axis=1) & (prefix <= 32)
+
+    ip = (octets[:, 0] << 24) | (octets[:, 1] << 16) | (octets[:, 2] << 8) | octets[:, 3]
+    return ip.astype(np.uint32), prefix.astype(np.uint8), valid
+
+
+def _format_ipv4_lines(ips: np.ndarray) -> bytes:
+    """Format uint32 addresses as newline-terminated dotted-quad bytes.
+
+    Uses the compiled Numba formatter when available. Otherwise each
+    address is laid out in a fixed 16-byte row using a digit lookup table,
+    then the NUL padding is dropped in a single masked copy.
+
+    Args:
+        ips: Array of uint32 addresses
+
+    Returns:
+        One "a.b.c.d\\n" line per address
+    """
+    if HAVE_NUMBA:
+        out = np.empty(ips.size * 16, dtype=np.uint8)
+        return out[: format_ipv4_batch(ips, out)].tobytes()
+
+    rows = np.zeros((ips.size, 16), dtype=np.uint8)
+    for i, shift in enumerate((24, 16, 8, 0)):
+        rows[:, 4 * i : 4 * i + 3] = _OCTET_DIGITS[(ips >> shift) & 0xFF]
+        rows[:, 4 * i + 3] = ord(".")
+    rows[:, 15] = ord("\n")
+    return rows[rows != 0].tobytes()
+
+
+def _parse_zone_numpy(data: bytes) -> Tuple[ZoneRanges, np.ndarray]:
+    """Parse zone file contents with vectorized NumPy operations.
+
+    Args:
+        data: Raw zone file contents
+
+    Returns:
+        Tuple of (parsed ranges, line numbers of invalid lines)
+    """
+    lines = np.char.strip(np.array(data.split(b"\n"), dtype=bytes))
+
+    # Skip empty lines and comments
+    keep = (np.char.str_len(lines) > 0) & ~np.char.startswith(lines, b"#")
+    line_nums = np.flatnonzero(keep) + 1
+
+    ip, prefix, valid = _parse_cidr_lines(lines[keep])
+
+    ip = ip[valid]
+    prefix = prefix[valid]
+    hostmask = np.uint64(0xFFFFFFFF) >> prefix.astype(np.uint64)
+    network = (ip & ~hostmask.astype(np.uint32)).astype(np.uint32)
+    broadcast = (network | hostmask.astype(np.uint32)).astype(np.uint32)
+
+    ranges = ZoneRanges(prefix, network, broadcast, hostmask + np.uint64(1))
+    return ranges, line_nums[~valid]
+
+
+def _parse_zone_numba(data: bytes) -> Tuple[ZoneRanges, np.ndarray]:
+    """Parse zone file contents with the compiled Numba kernel.
+
+    Args:
+        data: Raw zone file contents
+
+    Returns:
+        Tuple of (parsed ranges, line numbers of invalid lines)
+    """
+    buf = np.frombuffer(data, dtype=np.uint8)
+    capacity = data.count(b"\n") + 1
+
+    prefix = np.empty(capacity, dtype=np.uint8)
+    network = np.empty(capacity, dtype=np.uint32)
+    broadcast = np.empty(capacity, dtype=np.uint32)
+    total = np.empty(capacity, dtype=np.uint64)
+    invalid = np.empty(capacity, dtype=np.int64)
+
+    count, n_invalid = parse_zone_bytes(buf, prefix, network, broadcast, total, invalid)
+
+    ranges = ZoneRanges(prefix[:count], network[:count], broadcast[:count], total[:count])
+    return ranges, invalid[:n_invalid]
+
+
+def _format_ipv4(values: np.ndarray) -> List[str]:
+    """Format an array of uint32 addresses as dotted-quad strings."""
+    octets = (values.astype(np.uint32)[:, None] >> np.array([24, 16, 8, 0], np.uint32)) & 0xFF
+    return [f"{a}.{b}.{c}.{d}" for a, b, c, d in octets.tolist()]
+
 
 class CIDRConverter:
     """Converter for transforming CIDR notation to IP ranges."""
@@ -38,7 +247,7 @@ class CIDRConverter:
             output_dir: Directory to save converted files
             output_formats: List of output formats ('json', 'csv', 'txt', or 'all')
             sample_rate: Percentage of IPs to sample (0.0 to 1.0, default: 1.0)
-            max_workers: Number of threads to use for processing
+            max_workers: Number of worker processes to use for processing
             timeout: Timeout in seconds for efficient processing
             output_file_name: Optional explicit filename for output (only for single file input)
         """
@@ -86,46 +295,50 @@ class CIDRConverter:
             logger.warning(f"Error processing CIDR {cidr}: {e}")
             return None
 
-    def process_zone_file(self, zone_file_path: Path) -> List[Dict[str, any]]:
+    def process_zone_file(self, zone_file_path: Path) -> ZoneRanges:
         """Process a single .zone file and convert all CIDR entries.
 
+        The whole file is read in one shot and parsed with the compiled Numba
+        kernel when available, or with vectorized NumPy arithmetic otherwise.
+        Only IPv4 CIDRs are accepted; anything else is skipped.
+
         Args:
             zone_file_path: Path to the .zone file
 
         Returns:
-            List of dictionaries containing IP range information
+            ZoneRanges holding the parsed IP ranges
         """
-        ip_ranges = []
+        zone_file_path = Path(zone_file_path)
 
         try:
-            with open(zone_file_path, "r", encoding="utf-8") as f:
-                for line_num, line in enumerate(f, 1):
-                    line = line.strip()
-
-                    # Skip empty lines and comments
-                    if not line or line.startswith("#"):
-                        continue
-
-                    # Convert CIDR to IP range
-                    ip_range = self.cidr_to_ip_range(line)
-                    if ip_range:
-                        ip_ranges.append(ip_range)
-                    else:
-                        logger.debug(
-                            f"Skipping invalid line {line_num} in {zone_file_path.name}: {line}"
-                        )
-
+            data = zone_file_path.read_bytes()
         except Exception as e:
             logger.error(f"Error reading file {zone_file_path}: {e}")
+            return ZoneRanges.empty()
+
+        if HAVE_NUMBA:
+            ip_ranges, invalid = _parse_zone_numba(data)
+        else:
+            ip_ranges, invalid = _parse_zone_numpy(data)
+
+        if invalid.size and logger.isEnabledFor(logging.DEBUG):
+            lines = data.split(b"\n")
+            for line_num in invalid.tolist():
+                logger.debug(
+                    f"Skipping invalid line {line_num} in {zone_file_path.name}: "
+                    f"{lines[line_num - 1].strip().decode('utf-8', 'replace')}"
+                )
 
         return ip_ranges
 
-    def save_ranges_json(self, base_name: str, ip_ranges: List[Dict[str, any]]) -> None:
+    def save_ranges_json(self, base_name: str, ip_ranges: ZoneRanges) -> None:
         """Save IP ranges to a JSON file.
 
+        Uses orjson when installed, falling back to the standard json module.
+
         Args:
             base_name: Base name for the output file
-            ip_ranges: List of IP range dictionaries
+            ip_ranges: Parsed IP ranges
         """
         if self.output_file_name and len(self.output_formats) == 1:
             output_file = self.output_dir / self.output_file_name
@@ -133,30 +346,45 @@ class CIDRConverter:
             output_file = self.output_dir / f"{base_name}_ranges.json"
 
         try:
-            with open(output_file, "w", encoding="utf-8") as f:
-                json.dump(
+            payload = {
+                "source": base_name.upper(),
+                "total_ranges": ip_ranges.size,
+                "total_ips": ip_ranges.total_ips,
+                "sample_rate": self.sample_rate,
+                "ranges": [
                     {
-                        "source": base_name.upper(),
-                        "total_ranges": len(ip_ranges),
-                        "total_ips": sum(r["total_ips"] for r in ip_ranges),
-                        "sample_rate": self.sample_rate,
-                        "ranges": ip_ranges,
-                    },
-                    f,
-                    indent=2,
-                )
+                        "cidr": cidr,
+                        "start_ip": start_ip,
+                        "end_ip": end_ip,
+                        "total_ips": total_ips,
+                    }
+                    for cidr, start_ip, end_ip, total_ips in zip(
+                        ip_ranges.cidrs(),
+                        _format_ipv4(ip_ranges.network),
+                        _format_ipv4(ip_ranges.broadcast),
+                        ip_ranges.total.tolist(),
+                    )
+                ],
+            }
+
+            if orjson is not None:
+                with open(output_file, "wb") as f:
+                    f.write(orjson.dumps(payload, option=orjson.OPT_INDENT_2))
+            else:
+                with open(output_file, "w", encoding="utf-8") as f:
+                    json.dump(payload, f, indent=2)
 
             logger.debug(f"Saved JSON: {output_file.name}")
 
         except Exception as e:
             logger.error(f"Error saving JSON file for {base_name}: {e}")
 
-    def save_ranges_csv(self, base_name: str, ip_ranges: List[Dict[str, any]]) -> None:
+    def save_ranges_csv(self, base_name: str, ip_ranges: ZoneRanges) -> None:
         """Save IP ranges to a CSV file.
 
         Args:
             base_name: Base name for the output file
-            ip_ranges: List of IP range dictionaries
+            ip_ranges: Parsed IP ranges
         """
         if self.output_file_name and len(self.output_formats) == 1:
             output_file = self.output_dir / self.output_file_name
@@ -164,29 +392,37 @@ class CIDRConverter:
             output_file = self.output_dir / f"{base_name}_ranges.csv"
 
         try:
-            with open(output_file, "w", encoding="utf-8") as f:
+            rows = [
+                f"{cidr},{start_ip},{end_ip},{total_ips}\n"
+                for cidr, start_ip, end_ip, total_ips in zip(
+                    ip_ranges.cidrs(),
+                    _format_ipv4(ip_ranges.network),
+                    _format_ipv4(ip_ranges.broadcast),
+                    ip_ranges.total.tolist(),
+                )
+            ]
+
+            with open(output_file, "wb", buffering=_WRITE_BUFFER_SIZE) as f:
                 # Write header
-                f.write("CIDR,Start_IP,End_IP,Total_IPs\n")
+                f.write(b"CIDR,Start_IP,End_IP,Total_IPs\n")
 
-                # Write data
-                for ip_range in ip_ranges:
-                    f.write(
-                        f"{ip_range['cidr']},{ip_range['start_ip']},{ip_range['end_ip']},{ip_range['total_ips']}\n"
-                    )
+                # Write data in batches of rows
+                for start in range(0, len(rows), _CSV_BATCH_ROWS):
+                    f.write("".join(rows[start : start + _CSV_BATCH_ROWS]).encode("ascii"))
 
             logger.debug(f"Saved CSV: {output_file.name}")
 
         except Exception as e:
             logger.error(f"Error saving CSV file for {base_name}: {e}")
 
-    def save_ranges_txt(self, base_name: str, ip_ranges: List[Dict[str, any]]) -> None:
+    def save_ranges_txt(self, base_name: str, ip_ranges: ZoneRanges) -> None:
         """Save IP ranges to a simple text file with one IP per line.
 
         Supports sampling based on self.sample_rate.
 
         Args:
             base_name: Base name for the output file
-            ip_ranges: List of IP range dictionaries
+            ip_ranges: Parsed IP ranges
         """
         if self.output_file_name and len(self.output_formats) == 1:
             output_file = self.output_dir / self.output_file_name
@@ -194,37 +430,25 @@ class CIDRConverter:
             output_file = self.output_dir / f"{base_name}_ranges.txt"
 
         try:
-            with open(output_file, "w", encoding="utf-8") as f:
-                for ip_range in ip_ranges:
-                    try:
-                        # Reconstruct network object
-                        network = ipaddress.ip_network(ip_range["cidr"], strict=False)
-
-                        if self.sample_rate >= 1.0:
-                            # Write all IPs
-                            for ip in network:
-                                f.write(f"{ip}\n")
-                        elif self.sample_rate > 0.0:
-                            # Random sampling logic
-                            total_ips = network.num_addresses
-                            k = max(1, int(total_ips * self.sample_rate))
-
-                            if k >= total_ips:
-                                # Write all if sample size covers everything
-                                for ip in network:
-                                    f.write(f"{ip}\n")
-                            else:
-                                # Efficient random sampling using indices
-                                # random.sample on range() is efficient in Python 3
-                                indices = sorted(random.sample(range(total_ips), k))
-                                network_int = int(network.network_address)
-
-                                for idx in indices:
-                                    ip_int = network_int + idx
-                                    f.write(f"{ipaddress.IPv4Address(ip_int)}\n")
-
-                    except ValueError:
-                        logger.warning(f"Could not expand CIDR: {ip_range['cidr']} for {base_name}")
+            rng = np.random.default_rng()
+
+            with open(output_file, "wb", buffering=_WRITE_BUFFER_SIZE) as f:
+                for network_int, total_ips in zip(
+                    ip_ranges.network.tolist(), ip_ranges.total.tolist()
+                ):
+                    k = max(1, int(total_ips * self.sample_rate))
+
+                    if self.sample_rate >= 1.0 or k >= total_ips:
+                        # Write all IPs, a chunk at a time
+                        for offset in range(0, total_ips, _TXT_CHUNK_SIZE):
+                            count = min(_TXT_CHUNK_SIZE, total_ips - offset)
+                            ips = np.arange(count, dtype=np.uint32) + np.uint32(network_int + offset)
+                            f.write(_format_ipv4_lines(ips))
+                    elif self.sample_rate > 0.0:
+                        # Random sampling of offsets within the network
+                        indices = np.sort(rng.choice(total_ips, size=k, replace=False))
+                        ips = (indices + network_int).astype(np.uint32)
+                        f.write(_format_ipv4_lines(ips))
 
             logger.debug(f"Saved TXT: {output_file.name}")
 
@@ -247,14 +471,14 @@ class CIDRConverter:
         # Convert CIDR to IP ranges
         ip_ranges = self.process_zone_file(zone_file)
 
-        if not ip_ranges:
+        if not ip_ranges.size:
             logger.warning(f"No valid ranges found for {base_name.upper()}")
             return None
 
         # Update statistics (thread-safe updates might be needed if this were shared state,
         # but we are returning values to be aggregated)
-        file_ranges = len(ip_ranges)
-        file_ips = sum(r["total_ips"] for r in ip_ranges)
+        file_ranges = ip_ranges.size
+        file_ips = ip_ranges.total_ips
 
         # Save in requested format(s)
         if "json" in self.output_formats:
@@ -316,8 +540,14 @@ class CIDRConverter:
         self.processed_files = 0
         self.failed_files = 0
 
-        # Process files using ThreadPoolExecutor
-        with concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+        # Conversion is CPU-bound, so spread files over processes to sidestep the GIL;
+        # a single worker runs in-process to avoid the spawn and pickling overhead
+        if self.max_workers > 1:
+            executor = concurrent.futures.ProcessPoolExecutor(max_workers=self.max_workers)
+        else:
+            executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+
+        with executor:
             future_to_file = {executor.submit(self.convert_file, zf): zf for zf in zone_files}
 
             try:
@@ -380,7 +610,7 @@ def convert_cidr_ranges(
         output_dir: Output directory (overrides config)
         output_formats: Output formats (overrides config)
         sample_rate: Sampling rate (overrides config)
-        max_workers: Number of threads (default: 1)
+        max_workers: Number of worker processes (default: 1)
         timeout: Timeout in seconds
         output_file_name: Explicit output filename (only for single file input)
         config: Configuration dictionary
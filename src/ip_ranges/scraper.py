@@ -4,14 +4,18 @@ This module provides functionality to scrape and download IP ranges
 from ipdeny.com in .zone format.
 """
 
+import os
 import re
 import time
 import logging
+import threading
+import concurrent.futures
 from pathlib import Path
 from typing import List, Tuple, Optional
 from urllib.parse import urljoin
 
 import requests
+from requests.adapters import HTTPAdapter
 from bs4 import BeautifulSoup
 
 from .utils import ensure_directory, format_bytes
@@ -19,6 +23,36 @@ from .utils import ensure_directory, format_bytes
 
 logger = logging.getLogger(__name__)
 
+# Size of each chunk read from the response body
+_CHUNK_SIZE = 64 * 1024
+
+# Userspace buffer for zone files being written
+_WRITE_BUFFER_SIZE = 1 << 20
+
+
+class _RateLimiter:
+    """Space out request starts by a minimum interval across threads."""
+
+    def __init__(self, interval: float):
+        """Initialize the rate limiter.
+
+        Args:
+            interval: Minimum delay between two requests (seconds)
+        """
+        self.interval = interval
+        self._lock = threading.Lock()
+        self._next_time = 0.0
+
+    def wait(self) -> None:
+        """Block until the next request is allowed to start."""
+        with self._lock:
+            now = time.monotonic()
+            wait_time = self._next_time - now
+            self._next_time = max(now, self._next_time) + self.interval
+
+        if wait_time > 0:
+            time.sleep(wait_time)
+
 
 class IPRangeScraper:
     """Scraper for downloading IP range zone files from ipdeny.com."""
@@ -30,23 +64,34 @@ class IPRangeScraper:
         delay_seconds: float = 0.1,
         max_retries: int = 3,
         timeout: int = 30,
+        max_workers: int = 16,
     ):
         """Initialize the IP Range Scraper.
 
         Args:
             source_url: Base URL to scrape zone files from
             output_dir: Directory to save downloaded files
-            delay_seconds: Delay between requests (seconds)
+            delay_seconds: Minimum delay between request starts (seconds)
             max_retries: Maximum number of retry attempts
             timeout: Request timeout (seconds)
+            max_workers: Number of concurrent downloads
         """
         self.source_url = source_url
         self.output_dir = Path(output_dir)
         self.delay_seconds = delay_seconds
         self.max_retries = max_retries
         self.timeout = timeout
+        self.max_workers = max(1, max_workers)
+
+        # One pooled session so connections are reused across downloads
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=self.max_workers, pool_maxsize=self.max_workers)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self._rate_limiter = _RateLimiter(delay_seconds)
 
         # Statistics
+        self._stats_lock = threading.Lock()
         self.successful_downloads = 0
         self.failed_downloads = 0
 
@@ -59,7 +104,7 @@ class IPRangeScraper:
         logger.info(f"Fetching page: {self.source_url}")
 
         try:
-            response = requests.get(self.source_url, timeout=self.timeout)
+            response = self.session.get(self.source_url, timeout=self.timeout)
             response.raise_for_status()
         except requests.RequestException as e:
             logger.error(f"Error fetching page: {e}")
@@ -95,6 +140,7 @@ class IPRangeScraper:
         """
         filename = f"{country_code}.zone"
         filepath = self.output_dir / filename
+        partial_path = self.output_dir / f"{filename}.part"
 
         for attempt in range(1, self.max_retries + 1):
             try:
@@ -102,18 +148,23 @@ class IPRangeScraper:
                     f"Downloading {country_code.upper()} (attempt {attempt}/{self.max_retries})..."
                 )
 
-                response = requests.get(url, timeout=self.timeout)
-                response.raise_for_status()
+                self._rate_limiter.wait()
+                # Stream straight to disk rather than buffering the whole body
+                with self.session.get(url, stream=True, timeout=self.timeout) as response:
+                    response.raise_for_status()
 
-                with open(filepath, "wb") as f:
-                    f.write(response.content)
+                    with open(partial_path, "wb", buffering=_WRITE_BUFFER_SIZE) as f:
+                        for chunk in response.iter_content(chunk_size=_CHUNK_SIZE):
+                            f.write(chunk)
+                        file_size = f.tell()
 
-                file_size = len(response.content)
+                os.replace(partial_path, filepath)
                 logger.info(
                     f"✓ {country_code.upper()} downloaded ({format_bytes(file_size)})"
                 )
 
-                self.successful_downloads += 1
+                with self._stats_lock:
+                    self.successful_downloads += 1
                 return True
 
             except requests.RequestException as e:
@@ -129,7 +180,10 @@ class IPRangeScraper:
                     logger.error(
                         f"✗ Failed to download {country_code.upper()} after {self.max_retries} attempts"
                     )
-                    self.failed_downloads += 1
+                    if partial_path.exists():
+                        partial_path.unlink()
+                    with self._stats_lock:
+                        self.failed_downloads += 1
                     return False
 
         return False
@@ -158,10 +212,14 @@ class IPRangeScraper:
         self.successful_downloads = 0
         self.failed_downloads = 0
 
-        # Download each zone file
-        for country_code, url in zone_files:
-            self.download_zone_file(country_code, url)
-            time.sleep(self.delay_seconds)
+        # Download zone files concurrently; the rate limiter spaces out requests
+        with concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = [
+                executor.submit(self.download_zone_file, country_code, url)
+                for country_code, url in zone_files
+            ]
+            for future in futures:
+                future.result()
 
         # Summary
         logger.info("-" * 60)
@@ -179,12 +237,15 @@ class IPRangeScraper:
 
 
 def scrape_ip_ranges(
-    output_dir: Optional[str] = None, config: Optional[dict] = None
+    output_dir: Optional[str] = None,
+    max_workers: Optional[int] = None,
+    config: Optional[dict] = None,
 ) -> dict:
     """Convenience function to scrape IP ranges.
 
     Args:
         output_dir: Output directory (overrides config)
+        max_workers: Number of concurrent downloads (overrides config)
         config: Configuration dictionary
 
     Returns:
@@ -203,6 +264,7 @@ def scrape_ip_ranges(
         delay_seconds=scraper_config.get("delay_seconds", 0.1),
         max_retries=scraper_config.get("max_retries", 3),
         timeout=scraper_config.get("timeout", 30),
+        max_workers=max_workers or scraper_config.get("max_workers", 16),
     )
 
     return scraper.download_all()
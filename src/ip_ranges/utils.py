@@ -45,6 +45,7 @@ def get_default_config() -> Dict[str, Any]:
             "delay_seconds": 0.1,
             "max_retries": 3,
             "timeout": 30,
+            "max_workers": 16,
         },
         "converter": {
             "input_dir": "data/ip_zones",
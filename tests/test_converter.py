@@ -1,8 +1,10 @@
 """Tests for CIDR converter module."""
 
+import json
+
 import pytest
 from pathlib import Path
-from ip_ranges.converter import CIDRConverter
+from ip_ranges.converter import CIDRConverter, _parse_zone_numba, _parse_zone_numpy
 
 
 class TestCIDRConverter:
@@ -71,6 +73,161 @@ class TestCIDRConverter:
         assert "csv" in converter.output_formats
         assert "txt" in converter.output_formats
 
+    def test_process_zone_file(self, tmp_path):
+        """Test zone file parsing skips comments and invalid lines."""
+        zone_file = tmp_path / "xx.zone"
+        zone_file.write_text(
+            "# comment\n\n192.168.1.0/24\n 10.0.0.5/8 \n256.1.1.1/8\n1.2.3.4/33\ninvalid\n"
+        )
+
+        converter = CIDRConverter()
+        result = converter.process_zone_file(zone_file)
+
+        assert result.size == 2
+        assert result.cidrs() == ["192.168.1.0/24", "10.0.0.0/8"]
+        assert result.prefix.tolist() == [24, 8]
+        assert result.network.tolist() == [0xC0A80100, 0x0A000000]
+        assert result.broadcast.tolist() == [0xC0A801FF, 0x0AFFFFFF]
+        assert result.total.tolist() == [256, 16777216]
+        assert result.total_ips == 256 + 16777216
+
+    def test_process_zone_file_edge_prefixes(self, tmp_path):
+        """Test parsing of /0 and /32 networks."""
+        zone_file = tmp_path / "xx.zone"
+        zone_file.write_text("0.0.0.0/0\n8.8.8.8/32\n")
+
+        converter = CIDRConverter()
+        result = converter.process_zone_file(zone_file)
+
+        assert result.network.tolist() == [0, 0x08080808]
+        assert result.broadcast.tolist() == [0xFFFFFFFF, 0x08080808]
+        assert result.total.tolist() == [2**32, 1]
+
+    def test_process_zone_file_missing(self, tmp_path):
+        """Test that a missing zone file yields no ranges."""
+        converter = CIDRConverter()
+        result = converter.process_zone_file(tmp_path / "missing.zone")
+
+        assert result.size == 0
+    def test_convert_all_outputs(self, tmp_path):
+        """Test end-to-end conversion to JSON, CSV and TXT."""
+        zone_dir = tmp_path / "zones"
+        zone_dir.mkdir()
+        (zone_dir / "xx.zone").write_text("192.168.1.0/30\n10.0.0.1/32\n")
+
+        output_dir = tmp_path / "ranges"
+        converter = CIDRConverter(input_path=zone_dir, output_dir=output_dir)
+        stats = converter.convert_all()
+
+        assert stats["processed_files"] == 1
+        assert stats["total_ranges"] == 2
+        assert stats["total_ips"] == 5
+
+        data = json.loads((output_dir / "xx_ranges.json").read_text())
+        assert data["source"] == "XX"
+        assert data["total_ips"] == 5
+        assert data["ranges"][0] == {
+            "cidr": "192.168.1.0/30",
+            "start_ip": "192.168.1.0",
+            "end_ip": "192.168.1.3",
+            "total_ips": 4,
+        }
+
+        csv_lines = (output_dir / "xx_ranges.csv").read_text().splitlines()
+        assert csv_lines == [
+            "CIDR,Start_IP,End_IP,Total_IPs",
+            "192.168.1.0/30,192.168.1.0,192.168.1.3,4",
+            "10.0.0.1/32,10.0.0.1,10.0.0.1,1",
+        ]
+
+        txt_lines = (output_dir / "xx_ranges.txt").read_text().splitlines()
+        assert txt_lines == [
+            "192.168.1.0",
+            "192.168.1.1",
+            "192.168.1.2",
+            "192.168.1.3",
+            "10.0.0.1",
+        ]
+
+    def test_numba_kernel_matches_numpy(self):
+        """Test the Numba kernel and the NumPy fallback agree."""
+        pytest.importorskip("numba")
+        data = b"# comment\n1.2.3.0/24\r\n 10.0.0.5/8\n\n256.1.1.1/8\n8.8.8.8\nabc\n0.0.0.0/0"
+
+        numba_ranges, numba_invalid = _parse_zone_numba(data)
+        numpy_ranges, numpy_invalid = _parse_zone_numpy(data)
+
+        assert numba_invalid.tolist() == numpy_invalid.tolist() == [5, 7]
+        for numba_column, numpy_column in zip(numba_ranges, numpy_ranges):
+            assert numba_column.dtype == numpy_column.dtype
+            assert numba_column.tolist() == numpy_column.tolist()
+
+    def test_save_ranges_txt_sampled(self, tmp_path):
+        """Test sampled TXT output stays within each range."""
+        zone_file = tmp_path / "xx.zone"
+        zone_file.write_text("10.0.0.0/16\n192.168.1.0/24\n")
+
+        converter = CIDRConverter(output_dir=tmp_path, sample_rate=0.01)
+        converter.save_ranges_txt("xx", converter.process_zone_file(zone_file))
+
+        lines = (tmp_path / "xx_ranges.txt").read_text().splitlines()
+        assert len(lines) == 655 + 2
+        assert len(set(lines)) == len(lines)
+        assert all(line.startswith("10.0.") for line in lines[:655])
+        assert all(line.startswith("192.168.1.") for line in lines[655:])
+
+    def test_format_ipv4_lines_matches_fallback(self, monkeypatch):
+        """Test the Numba formatter and the NumPy fallback agree."""
+        pytest.importorskip("numba")
+        import numpy as np
+        from ip_ranges import converter as converter_module
+
+        ips = np.array([0, 1, 0x0A00FF09, 0xC0A80164, 0xFFFFFFFF], dtype=np.uint32)
+        expected = b"0.0.0.0\n0.0.0.1\n10.0.255.9\n192.168.1.100\n255.255.255.255\n"
+
+        assert converter_module._format_ipv4_lines(ips) == expected
+        monkeypatch.setattr(converter_module, "HAVE_NUMBA", False)
+        assert converter_module._format_ipv4_lines(ips) == expected
+
+    def test_save_ranges_json_matches_fallback(self, tmp_path, monkeypatch):
+        """Test orjson output is identical to the json module fallback."""
+        pytest.importorskip("orjson")
+        from ip_ranges import converter as converter_module
+
+        zone_file = tmp_path / "xx.zone"
+        zone_file.write_text("192.168.1.0/24\n10.0.0.0/8\n")
+        converter = CIDRConverter(output_dir=tmp_path)
+        ip_ranges = converter.process_zone_file(zone_file)
+
+        converter.save_ranges_json("fast", ip_ranges)
+        monkeypatch.setattr(converter_module, "orjson", None)
+        converter.save_ranges_json("slow", ip_ranges)
+
+        fast = (tmp_path / "fast_ranges.json").read_text()
+        slow = (tmp_path / "slow_ranges.json").read_text()
+        assert fast.replace('"FAST"', '"SLOW"') == slow
+
+    def test_convert_all_multiple_workers(self, tmp_path):
+        """Test conversion spread over worker processes."""
+        zone_dir = tmp_path / "zones"
+        zone_dir.mkdir()
+        for code in ("aa", "bb", "cc"):
+            (zone_dir / f"{code}.zone").write_text("192.168.1.0/24\n")
+
+        output_dir = tmp_path / "ranges"
+        converter = CIDRConverter(
+            input_path=zone_dir, output_dir=output_dir, output_formats=["csv"], max_workers=2
+        )
+        stats = converter.convert_all()
+
+        assert stats["processed_files"] == 3
+        assert stats["total_ips"] == 3 * 256
+        assert sorted(p.name for p in output_dir.iterdir()) == [
+            "aa_ranges.csv",
+            "bb_ranges.csv",
+            "cc_ranges.csv",
+        ]
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,101 @@
+"""Tests for IP range scraper module."""
+
+import pytest
+import requests
+from ip_ranges.scraper import IPRangeScraper
+
+
+INDEX_HTML = b"""
+<html><body>
+<a href="data/countries/ir.zone">ir.zone</a>
+<a href="data/countries/us.zone">us.zone</a>
+<a href="data/countries/all-zones.tar.gz">all</a>
+<a href="other/xx.zone">xx.zone</a>
+</body></html>
+"""
+
+
+class FakeResponse:
+    """Minimal stand-in for requests.Response."""
+
+    def __init__(self, content: bytes, status_code: int = 200):
+        self.content = content
+        self.status_code = status_code
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"{self.status_code} Error")
+
+    def iter_content(self, chunk_size=1):
+        for start in range(0, len(self.content), chunk_size):
+            yield self.content[start : start + chunk_size]
+
+
+class FakeSession:
+    """Session returning canned responses keyed by URL."""
+
+    def __init__(self, responses):
+        self.responses = responses
+        self.requested = []
+
+    def get(self, url, **kwargs):
+        self.requested.append(url)
+        return self.responses[url]
+
+
+class TestIPRangeScraper:
+    """Test cases for IPRangeScraper class."""
+
+    def make_scraper(self, tmp_path, responses):
+        scraper = IPRangeScraper(
+            source_url="https://example.com/ipblocks/",
+            output_dir=tmp_path,
+            delay_seconds=0,
+            max_retries=2,
+            max_workers=4,
+        )
+        scraper.session = FakeSession(responses)
+        return scraper
+
+    def test_scrape_zone_files(self, tmp_path):
+        """Test extraction of country zone links from the index page."""
+        scraper = self.make_scraper(
+            tmp_path, {"https://example.com/ipblocks/": FakeResponse(INDEX_HTML)}
+        )
+
+        assert scraper.scrape_zone_files() == [
+            ("ir", "https://example.com/ipblocks/data/countries/ir.zone"),
+            ("us", "https://example.com/ipblocks/data/countries/us.zone"),
+        ]
+
+    def test_download_all(self, tmp_path):
+        """Test concurrent download with one failing file."""
+        scraper = self.make_scraper(
+            tmp_path,
+            {
+                "https://example.com/ipblocks/": FakeResponse(INDEX_HTML),
+                "https://example.com/ipblocks/data/countries/ir.zone": FakeResponse(
+                    b"1.2.3.0/24\n"
+                ),
+                "https://example.com/ipblocks/data/countries/us.zone": FakeResponse(
+                    b"", status_code=503
+                ),
+            },
+        )
+
+        stats = scraper.download_all()
+
+        assert stats == {"total": 2, "successful": 1, "failed": 1}
+        assert (tmp_path / "ir.zone").read_bytes() == b"1.2.3.0/24\n"
+        assert not (tmp_path / "us.zone").exists()
+        assert not list(tmp_path.glob("*.part"))
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])